@@ -4,18 +4,17 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from typing import List, Dict, Any
-import copy
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple
+import heapq
 from datetime import datetime
 
 # Import our custom modules
 from nexo_data import (
-    NEXO_BUYERS, NEXO_SELLERS, TIME_SLOTS,
+    NEXO_BUYERS, NEXO_SELLERS, TIME_SLOTS, SLOTS_BY_DATE, BUYERS_BY_ID, SELLERS_BY_ID, SELLERS_BY_PRODUCT,
     get_buyers_df, get_sellers_df, get_event_summary, get_sponsorship_limits
 )
-from matching_algorithm import NEXOEventMatcher, Match
+from matching_algorithm import NEXOEventMatcher, Match, DEFAULT_COMPATIBILITY_WEIGHTS
 
 # Page configuration
 st.set_page_config(
@@ -69,6 +68,135 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Static tier/meeting-limit table for the dashboard; only counts change per run
+_TIER_LIMITS = pd.DataFrame({
+    'Tier': ['Platinum', 'Gold', 'Silver', 'Bronze'],
+    'Meeting Limit': [20, 20, 15, 10]
+})
+
+# Event size is fixed for the lifetime of the app
+_N_BUYERS = len(NEXO_BUYERS)
+_N_SELLERS = len(NEXO_SELLERS)
+_N_SLOTS = len(TIME_SLOTS)
+
+# Cached data accessors - Streamlit reruns the whole script on every interaction.
+# The participant DataFrames and event summary come straight from nexo_data, which
+# builds them once and hands out copies; only values derived from them are cached here
+@st.cache_data
+def load_buyer_values(column: str) -> List[Any]:
+    """Return cached distinct values of a buyer column, in order of appearance"""
+    return get_buyers_df()[column].dropna().unique().tolist()
+
+@st.cache_data
+def load_seller_values(column: str) -> List[Any]:
+    """Return cached distinct values of a seller column, in order of appearance"""
+    return get_sellers_df()[column].dropna().unique().tolist()
+
+@st.cache_data
+def load_buyer_counts(column: str) -> pd.Series:
+    """Return cached value counts of a buyer column"""
+    return get_buyers_df()[column].value_counts()
+
+# Figures are held as live objects rather than pickled copies: unpickling a
+# Figure re-validates every property, while st.plotly_chart only serializes
+# a Figure it is handed. Cached figures are shared, so treat them as read-only;
+# the cache is process-wide, so it is bounded to keep one-off inputs from piling up.
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _build_figure(chart_type: str, data: Optional[pd.DataFrame] = None,
+                  layout: Optional[Dict[str, Any]] = None, **kwargs):
+    """Build a Plotly Express figure once per unique chart type and inputs"""
+    # Imported lazily so pages without charts never pay Plotly's import cost
+    import plotly.express as px
+    fig = getattr(px, chart_type)(data, **kwargs)
+    if layout:
+        fig.update_layout(**layout)
+    return fig
+
+def get_matcher() -> NEXOEventMatcher:
+    """Return this session's matching engine, creating it on first use"""
+    if 'matcher' not in st.session_state:
+        st.session_state.matcher = NEXOEventMatcher()
+    return st.session_state.matcher
+
+def matches_to_df(matches: List[Match]) -> pd.DataFrame:
+    """Return matches as a columnar DataFrame (one column per match field)"""
+    return pd.DataFrame({
+        'buyer_id': [match.buyer_id for match in matches],
+        'seller_id': [match.seller_id for match in matches],
+        'match_type': [match.match_type for match in matches],
+        'compatibility_score': [match.compatibility_score for match in matches],
+        'priority': [match.priority for match in matches]
+    })
+
+def summarize_matches(matches_df: pd.DataFrame) -> Tuple[pd.Series, float]:
+    """Return match type counts and average compatibility"""
+    return matches_df['match_type'].value_counts(), matches_df['compatibility_score'].mean()
+
+def with_participant_names(df: pd.DataFrame) -> pd.DataFrame:
+    """Join buyer/seller names and companies onto rows keyed by buyer_id/seller_id"""
+    buyer_cols = get_buyers_df()[['id', 'name', 'company']].rename(
+        columns={'id': 'buyer_id', 'name': 'Buyer', 'company': 'Buyer Company'}
+    )
+    seller_cols = get_sellers_df()[['id', 'name', 'company']].rename(
+        columns={'id': 'seller_id', 'name': 'Seller', 'company': 'Seller Company'}
+    )
+    named_df = df.merge(buyer_cols, on='buyer_id', how='left').merge(seller_cols, on='seller_id', how='left')
+    return named_df.fillna({'Buyer': 'Unknown', 'Buyer Company': 'Unknown', 'Seller': 'Unknown', 'Seller Company': 'Unknown'})
+
+def build_display_table(df: pd.DataFrame) -> pd.DataFrame:
+    """Return match/meeting rows with participant names and formatted display columns"""
+    table = with_participant_names(df)
+    table['Match Type'] = table['match_type'].str.replace('_', ' ').str.title()
+    table['Compatibility'] = table['compatibility_score'].map('{:.1f}%'.format)
+    return table.rename(columns={'date': 'Date', 'time': 'Time', 'priority': 'Priority'})
+
+@st.cache_data(show_spinner=False)
+def build_schedule_df(scheduled_meetings: List[Dict]) -> pd.DataFrame:
+    """Build the complete schedule table for display"""
+    schedule_df = build_display_table(pd.DataFrame(scheduled_meetings))
+    return schedule_df[['Date', 'Time', 'Buyer', 'Buyer Company', 'Seller', 'Seller Company',
+                        'Match Type', 'Compatibility', 'Priority']]
+
+@st.cache_data(show_spinner=False)
+def build_schedule_csv(scheduled_meetings: List[Dict]) -> str:
+    """Export the complete schedule as CSV text (format owned by the matcher's exporter)"""
+    # A fresh matcher: the export uses no matcher state, and cached functions must not touch session_state
+    return NEXOEventMatcher().export_schedule_csv(scheduled_meetings, NEXO_BUYERS, NEXO_SELLERS)
+
+def build_matching_potential_figures(matches: List[Match], matches_df: pd.DataFrame) -> Tuple[Any, Any]:
+    """Build the compatibility histogram and top-10 pairs chart for the analytics page"""
+    # Compatibility score distribution
+    fig_compatibility = _build_figure(
+        'histogram',
+        x=matches_df['compatibility_score'].tolist(),
+        nbins=20,
+        title="Compatibility Score Distribution",
+        labels={'x': 'Compatibility Score (%)', 'count': 'Number of Matches'}
+    )
+    
+    # Top buyer-seller pairs
+    top_matches = heapq.nlargest(10, matches, key=lambda x: x.compatibility_score)
+    
+    pairs = [
+        f"{BUYERS_BY_ID.get(match.buyer_id, {}).get('name', 'Unknown')} - "
+        f"{SELLERS_BY_ID.get(match.seller_id, {}).get('name', 'Unknown')}"
+        for match in top_matches
+    ]
+    scores = np.fromiter((match.compatibility_score for match in top_matches), dtype=float, count=len(top_matches))
+    
+    top_df = pd.DataFrame({'Pair': pairs, 'Compatibility': scores})
+    
+    fig_top = _build_figure(
+        'bar',
+        top_df,
+        x='Compatibility',
+        y='Pair',
+        orientation='h',
+        title="Top 10 Compatibility Matches",
+        labels={'Compatibility': 'Compatibility Score (%)'}
+    )
+    return fig_compatibility, fig_top
+
 def main():
     """Main application function"""
     
@@ -168,15 +296,16 @@ def show_dashboard():
     
     buyers_df = get_buyers_df()
     if not buyers_df.empty:
-        tier_counts = buyers_df['sponsorship_tier'].value_counts()
+        tier_counts = load_buyer_counts('sponsorship_tier')
         
         col1, col2 = st.columns(2)
         
         with col1:
             # Create pie chart for sponsorship tiers
-            fig_tier = px.pie(
-                values=tier_counts.values,
-                names=tier_counts.index,
+            fig_tier = _build_figure(
+                'pie',
+                values=tier_counts.tolist(),
+                names=tier_counts.index.tolist(),
                 title="Buyers by Sponsorship Tier",
                 color_discrete_map={
                     'Platinum': '#FFD700',
@@ -189,14 +318,12 @@ def show_dashboard():
         
         with col2:
             # Meeting limits by tier
-            limits_df = pd.DataFrame([
-                {'Tier': 'Platinum', 'Meeting Limit': 20, 'Count': tier_counts.get('Platinum', 0)},
-                {'Tier': 'Gold', 'Meeting Limit': 20, 'Count': tier_counts.get('Gold', 0)},
-                {'Tier': 'Silver', 'Meeting Limit': 15, 'Count': tier_counts.get('Silver', 0)},
-                {'Tier': 'Bronze', 'Meeting Limit': 10, 'Count': tier_counts.get('Bronze', 0)}
-            ])
+            limits_df = _TIER_LIMITS.assign(
+                Count=tier_counts.reindex(_TIER_LIMITS['Tier'], fill_value=0).values
+            )
             
-            fig_limits = px.bar(
+            fig_limits = _build_figure(
+                'bar',
                 limits_df,
                 x='Tier',
                 y='Count',
@@ -215,34 +342,37 @@ def show_participants():
     """Display participant information"""
     st.markdown('<h2 class="sub-header">👥 Event Participants</h2>', unsafe_allow_html=True)
     
+    buyers_df = get_buyers_df()
+    sellers_df = get_sellers_df()
+    
     tab1, tab2 = st.tabs(["🏢 Buyers", "🏪 Sellers"])
     
     with tab1:
         st.subheader("🏢 Buyer Portfolio")
-        buyers_df = get_buyers_df()
         
         if not buyers_df.empty:
             # Buyer filters
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                regions = buyers_df['region'].unique()
-                selected_regions = st.multiselect("Filter by Region", regions, default=list(regions))
+                regions = load_buyer_values('region')
+                selected_regions = st.multiselect("Filter by Region", regions, default=regions)
             
             with col2:
-                tiers = buyers_df['sponsorship_tier'].unique()
-                selected_tiers = st.multiselect("Filter by Sponsorship", tiers, default=list(tiers))
+                tiers = load_buyer_values('sponsorship_tier')
+                selected_tiers = st.multiselect("Filter by Sponsorship", tiers, default=tiers)
             
             with col3:
-                facilities = buyers_df['facility_type'].unique()
-                selected_facilities = st.multiselect("Filter by Facility Type", facilities, default=list(facilities))
+                facilities = load_buyer_values('facility_type')
+                selected_facilities = st.multiselect("Filter by Facility Type", facilities, default=facilities)
             
             # Apply filters
-            filtered_buyers = buyers_df[
-                (buyers_df['region'].isin(selected_regions)) &
-                (buyers_df['sponsorship_tier'].isin(selected_tiers)) &
-                (buyers_df['facility_type'].isin(selected_facilities))
-            ]
+            buyer_mask = np.logical_and.reduce([
+                buyers_df['region'].isin(selected_regions).values,
+                buyers_df['sponsorship_tier'].isin(selected_tiers).values,
+                buyers_df['facility_type'].isin(selected_facilities).values
+            ])
+            filtered_buyers = buyers_df[buyer_mask]
             
             # Display filtered buyers
             st.dataframe(
@@ -255,19 +385,21 @@ def show_participants():
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    fig_investment = px.bar(
-                        filtered_buyers,
+                    fig_investment = _build_figure(
+                        'bar',
+                        filtered_buyers[['name', 'investment_amount']],
+                        layout={'xaxis_tickangle': 45},
                         x='name',
                         y='investment_amount',
                         title="Investment Amount by Buyer",
                         labels={'investment_amount': 'Investment ($)', 'name': 'Buyer'}
                     )
-                    fig_investment.update_xaxes(tickangle=45)
                     st.plotly_chart(fig_investment, use_container_width=True)
                 
                 with col2:
-                    fig_locations = px.scatter(
-                        filtered_buyers,
+                    fig_locations = _build_figure(
+                        'scatter',
+                        filtered_buyers[['locations', 'investment_amount', 'sponsorship_tier']],
                         x='locations',
                         y='investment_amount',
                         size='investment_amount',
@@ -279,34 +411,29 @@ def show_participants():
     
     with tab2:
         st.subheader("🏪 Seller Portfolio")
-        sellers_df = get_sellers_df()
         
         if not sellers_df.empty:
             # Seller filters
             col1, col2 = st.columns(2)
             
             with col1:
-                regions = sellers_df['region'].unique()
-                selected_regions = st.multiselect("Filter by Region", regions, default=list(regions), key="seller_regions")
+                regions = load_seller_values('region')
+                selected_regions = st.multiselect("Filter by Region", regions, default=regions, key="seller_regions")
             
             with col2:
-                # Extract unique products
-                all_products = []
-                for products in sellers_df['products']:
-                    all_products.extend(products)
-                unique_products = list(set(all_products))
+                # Products offered by at least one seller, in order of first appearance
+                unique_products = list(SELLERS_BY_PRODUCT)
                 selected_products = st.multiselect("Filter by Products", unique_products, default=unique_products)
             
             # Apply filters
-            filtered_sellers = sellers_df[
-                (sellers_df['region'].isin(selected_regions))
-            ]
+            seller_mask = sellers_df['region'].isin(selected_regions)
             
             # Additional product filter
             if selected_products:
-                filtered_sellers = filtered_sellers[
-                    filtered_sellers['products'].apply(lambda x: any(p in selected_products for p in x))
-                ]
+                product_sellers = frozenset().union(*(SELLERS_BY_PRODUCT.get(p, ()) for p in selected_products))
+                seller_mask &= sellers_df['id'].isin(product_sellers)
+            
+            filtered_sellers = sellers_df[seller_mask]
             
             # Display filtered sellers
             st.dataframe(
@@ -320,14 +447,12 @@ def show_participants():
                 
                 with col1:
                     # Product distribution
-                    product_counts = {}
-                    for products in filtered_sellers['products']:
-                        for product in products:
-                            product_counts[product] = product_counts.get(product, 0) + 1
+                    product_counts = filtered_sellers['products'].explode().value_counts(sort=False)
                     
-                    fig_products = px.bar(
-                        x=list(product_counts.keys()),
-                        y=list(product_counts.values()),
+                    fig_products = _build_figure(
+                        'bar',
+                        x=product_counts.index.tolist(),
+                        y=product_counts.tolist(),
                         title="Product/Service Distribution",
                         labels={'x': 'Product/Service', 'y': 'Number of Sellers'}
                     )
@@ -336,9 +461,11 @@ def show_participants():
                 with col2:
                     # Regional distribution
                     region_counts = filtered_sellers['region'].value_counts()
-                    fig_regions = px.pie(
-                        values=region_counts.values,
-                        names=region_counts.index,
+                    region_counts = region_counts[region_counts > 0]  # drop filtered-out categories
+                    fig_regions = _build_figure(
+                        'pie',
+                        values=region_counts.tolist(),
+                        names=region_counts.index.tolist(),
                         title="Sellers by Region"
                     )
                     st.plotly_chart(fig_regions, use_container_width=True)
@@ -349,6 +476,11 @@ def show_generate_matches():
     
     st.info("Configure and run the NEXO matching algorithm to find optimal buyer-seller matches using the 3-tier priority system.")
     
+    _match_config_fragment()
+
+@st.fragment
+def _match_config_fragment():
+    """Algorithm configuration and run panel - reruns on its own when sliders change"""
     # Algorithm configuration
     st.subheader("⚙️ Algorithm Configuration")
     
@@ -380,6 +512,8 @@ def show_generate_matches():
             'Existing Relationship': relationship_weight / total_weight
         }
         
+        # Built directly: the inputs change on every slider drag, so caching would only fill the cache
+        import plotly.express as px
         fig_weights = px.bar(
             x=list(weights.keys()),
             y=list(weights.values()),
@@ -393,8 +527,8 @@ def show_generate_matches():
     
     if st.button("🎯 Generate Matches", type="primary", use_container_width=True):
         with st.spinner("Running NEXO matching algorithm..."):
-            # Initialize matching engine
-            matcher = NEXOEventMatcher()
+            # Reuse this session's matching engine
+            matcher = get_matcher()
             
             # Update compatibility weights
             if total_weight > 0:
@@ -405,28 +539,22 @@ def show_generate_matches():
                     'facility_type': facility_weight / total_weight,
                     'existing_client': relationship_weight / total_weight
                 }
+            else:
+                matcher.compatibility_weights = dict(DEFAULT_COMPATIBILITY_WEIGHTS)
             
-            # Get data (make copies to avoid modifying original)
-            buyers_copy = copy.deepcopy(NEXO_BUYERS)
-            sellers_copy = copy.deepcopy(NEXO_SELLERS)
-            
-            # Run matching
-            matches = matcher.find_matches(buyers_copy, sellers_copy)
+            # Run matching (find_matches only reads the participant records)
+            matches = matcher.find_matches(NEXO_BUYERS, NEXO_SELLERS)
             
             # Store results in session state
             st.session_state.matches = matches
-            st.session_state.matcher = matcher
+            st.session_state.matches_df = matches_to_df(matches)
             
             st.success(f"✅ Matching completed! Found {len(matches)} potential matches.")
             
             # Display quick summary
             if matches:
                 # Calculate statistics
-                match_types = {}
-                for match in matches:
-                    match_types[match.match_type] = match_types.get(match.match_type, 0) + 1
-                
-                avg_compatibility = sum(match.compatibility_score for match in matches) / len(matches)
+                match_types, avg_compatibility = summarize_matches(st.session_state.matches_df)
                 
                 col1, col2, col3 = st.columns(3)
                 
@@ -451,7 +579,8 @@ def show_generate_matches():
                         {'Type': 'AI Suggestion', 'Count': match_types.get('ai_suggestion', 0), 'Priority': 3}
                     ])
                     
-                    fig_types = px.bar(
+                    fig_types = _build_figure(
+                        'bar',
                         match_type_df,
                         x='Type',
                         y='Count',
@@ -464,11 +593,11 @@ def show_generate_matches():
                 with col2:
                     # Top matches preview
                     st.markdown("**🏆 Top Matches Preview**")
-                    top_matches = sorted(matches, key=lambda x: (x.priority, -x.compatibility_score))[:5]
+                    top_matches = heapq.nsmallest(5, matches, key=lambda x: (x.priority, -x.compatibility_score))
                     
                     for i, match in enumerate(top_matches):
-                        buyer_name = next((b['name'] for b in NEXO_BUYERS if b['id'] == match.buyer_id), 'Unknown')
-                        seller_name = next((s['name'] for s in NEXO_SELLERS if s['id'] == match.seller_id), 'Unknown')
+                        buyer_name = BUYERS_BY_ID.get(match.buyer_id, {}).get('name', 'Unknown')
+                        seller_name = SELLERS_BY_ID.get(match.seller_id, {}).get('name', 'Unknown')
                         
                         st.markdown(f"""
                         **{i+1}.** {buyer_name} ↔ {seller_name}  
@@ -486,7 +615,7 @@ def show_create_schedule():
     matches = st.session_state.matches
     matcher = st.session_state.matcher
     
-    st.info(f"📋 Ready to schedule {len(matches)} matches across {len(TIME_SLOTS)} available time slots.")
+    st.info(f"📋 Ready to schedule {len(matches)} matches across {_N_SLOTS} available time slots.")
     
     # Show available time slots
     st.subheader("🕐 Available Time Slots")
@@ -495,14 +624,12 @@ def show_create_schedule():
     
     with col1:
         st.markdown("**May 18, 2023**")
-        may_18_slots = [slot for slot in TIME_SLOTS if slot['date'] == '2023-05-18']
-        for slot in may_18_slots:
+        for slot in SLOTS_BY_DATE.get('2023-05-18', []):
             st.text(f"• {slot['time']} ({slot['duration']} min)")
     
     with col2:
         st.markdown("**May 19, 2023**")
-        may_19_slots = [slot for slot in TIME_SLOTS if slot['date'] == '2023-05-19']
-        for slot in may_19_slots:
+        for slot in SLOTS_BY_DATE.get('2023-05-19', []):
             st.text(f"• {slot['time']} ({slot['duration']} min)")
     
     # Create schedule
@@ -540,23 +667,12 @@ def show_create_schedule():
                 # Show schedule preview
                 st.subheader("📋 Schedule Preview")
                 
-                # Create schedule DataFrame
-                schedule_data = []
-                for meeting in scheduled_meetings[:10]:  # Show first 10
-                    buyer_name = next((b['name'] for b in NEXO_BUYERS if b['id'] == meeting['buyer_id']), 'Unknown')
-                    seller_name = next((s['name'] for s in NEXO_SELLERS if s['id'] == meeting['seller_id']), 'Unknown')
-                    
-                    schedule_data.append({
-                        'Date': meeting['date'],
-                        'Time': meeting['time'],
-                        'Buyer': buyer_name,
-                        'Seller': seller_name,
-                        'Type': meeting['match_type'].replace('_', ' ').title(),
-                        'Compatibility': f"{meeting['compatibility_score']:.1f}%"
-                    })
-                
-                schedule_df = pd.DataFrame(schedule_data)
-                st.dataframe(schedule_df, use_container_width=True)
+                # Create schedule DataFrame (shares the cached complete schedule table)
+                schedule_df = build_schedule_df(scheduled_meetings).head(10)  # Show first 10
+                st.dataframe(
+                    schedule_df.rename(columns={'Match Type': 'Type'})[['Date', 'Time', 'Buyer', 'Seller', 'Type', 'Compatibility']],
+                    use_container_width=True
+                )
                 
                 if len(scheduled_meetings) > 10:
                     st.info(f"Showing first 10 meetings. Total: {len(scheduled_meetings)} meetings scheduled.")
@@ -570,6 +686,7 @@ def show_match_results():
         return
     
     matches = st.session_state.matches
+    matches_df = st.session_state.matches_df
     
     # Check if we have scheduled meetings
     has_schedule = 'scheduled_meetings' in st.session_state and st.session_state.scheduled_meetings
@@ -603,7 +720,8 @@ def show_match_results():
         with col1:
             # Match type distribution
             match_types = stats['match_type_distribution']
-            fig_types = px.pie(
+            fig_types = _build_figure(
+                'pie',
                 values=list(match_types.values()),
                 names=[name.replace('_', ' ').title() for name in match_types.keys()],
                 title="Match Type Distribution"
@@ -613,7 +731,8 @@ def show_match_results():
         with col2:
             # Priority distribution
             priority_dist = stats['priority_distribution']
-            fig_priority = px.bar(
+            fig_priority = _build_figure(
+                'bar',
                 x=list(priority_dist.keys()),
                 y=list(priority_dist.values()),
                 title="Priority Distribution",
@@ -624,26 +743,9 @@ def show_match_results():
         # Detailed schedule table
         st.subheader("📅 Complete Schedule")
         
-        # Create detailed schedule DataFrame
-        schedule_data = []
-        for meeting in scheduled_meetings:
-            buyer_info = next((b for b in NEXO_BUYERS if b['id'] == meeting['buyer_id']), {})
-            seller_info = next((s for s in NEXO_SELLERS if s['id'] == meeting['seller_id']), {})
-            
-            schedule_data.append({
-                'Date': meeting['date'],
-                'Time': meeting['time'],
-                'Buyer': buyer_info.get('name', 'Unknown'),
-                'Buyer Company': buyer_info.get('company', 'Unknown'),
-                'Seller': seller_info.get('name', 'Unknown'),
-                'Seller Company': seller_info.get('company', 'Unknown'),
-                'Match Type': meeting['match_type'].replace('_', ' ').title(),
-                'Compatibility': f"{meeting['compatibility_score']:.1f}%",
-                'Priority': meeting['priority']
-            })
-        
-        schedule_df = pd.DataFrame(schedule_data)
-        st.dataframe(schedule_df, use_container_width=True)
+        # Create detailed schedule DataFrame (built once per schedule)
+        schedule_df = build_schedule_df(scheduled_meetings)
+        st.dataframe(schedule_df, use_container_width=True, height=400)
         
         # Export functionality
         st.subheader("📥 Export Schedule")
@@ -652,8 +754,7 @@ def show_match_results():
         
         with col1:
             if st.button("📄 Export as CSV", use_container_width=True):
-                matcher = st.session_state.matcher
-                csv_data = matcher.export_schedule_csv(scheduled_meetings, NEXO_BUYERS, NEXO_SELLERS)
+                csv_data = build_schedule_csv(scheduled_meetings)
                 st.download_button(
                     label="💾 Download CSV",
                     data=csv_data,
@@ -691,11 +792,7 @@ Priority Distribution:
         st.info("📋 Showing match results. Create a schedule to see detailed scheduling information.")
         
         # Match summary
-        match_types = {}
-        for match in matches:
-            match_types[match.match_type] = match_types.get(match.match_type, 0) + 1
-        
-        avg_compatibility = sum(match.compatibility_score for match in matches) / len(matches)
+        match_types, avg_compatibility = summarize_matches(matches_df)
         
         col1, col2, col3 = st.columns(3)
         
@@ -711,23 +808,12 @@ Priority Distribution:
         # Detailed match table
         st.subheader("📋 All Matches")
         
-        match_data = []
-        for match in matches:
-            buyer_info = next((b for b in NEXO_BUYERS if b['id'] == match.buyer_id), {})
-            seller_info = next((s for s in NEXO_SELLERS if s['id'] == match.seller_id), {})
-            
-            match_data.append({
-                'Buyer': buyer_info.get('name', 'Unknown'),
-                'Buyer Company': buyer_info.get('company', 'Unknown'),
-                'Seller': seller_info.get('name', 'Unknown'),
-                'Seller Company': seller_info.get('company', 'Unknown'),
-                'Match Type': match.match_type.replace('_', ' ').title(),
-                'Compatibility': f"{match.compatibility_score:.1f}%",
-                'Priority': match.priority
-            })
-        
-        match_df = pd.DataFrame(match_data)
-        st.dataframe(match_df, use_container_width=True)
+        match_df = build_display_table(matches_df)
+        st.dataframe(
+            match_df[['Buyer', 'Buyer Company', 'Seller', 'Seller Company', 'Match Type', 'Compatibility', 'Priority']],
+            use_container_width=True,
+            height=400
+        )
 
 def show_analytics():
     """Display advanced analytics"""
@@ -743,8 +829,9 @@ def show_analytics():
     
     with col1:
         # Investment distribution
-        fig_investment = px.histogram(
-            buyers_df,
+        fig_investment = _build_figure(
+            'histogram',
+            buyers_df[['investment_amount']],
             x='investment_amount',
             nbins=10,
             title="Investment Amount Distribution",
@@ -754,10 +841,11 @@ def show_analytics():
     
     with col2:
         # Regional distribution
-        region_counts = buyers_df['region'].value_counts()
-        fig_regions = px.pie(
-            values=region_counts.values,
-            names=region_counts.index,
+        region_counts = load_buyer_counts('region')
+        fig_regions = _build_figure(
+            'pie',
+            values=region_counts.tolist(),
+            names=region_counts.index.tolist(),
             title="Buyer Distribution by Region"
         )
         st.plotly_chart(fig_regions, use_container_width=True)
@@ -766,46 +854,21 @@ def show_analytics():
     if 'matches' in st.session_state and st.session_state.matches:
         st.subheader("🎯 Matching Potential Analysis")
         
-        matches = st.session_state.matches
-        
-        # Compatibility score distribution
-        compatibility_scores = [match.compatibility_score for match in matches]
+        # Figures are rebuilt only when a new matching run replaces matches_df
+        matches_df = st.session_state.matches_df
+        if st.session_state.get('analytics_source') is not matches_df:
+            st.session_state.analytics_figures = build_matching_potential_figures(
+                st.session_state.matches, matches_df
+            )
+            st.session_state.analytics_source = matches_df
+        fig_compatibility, fig_top = st.session_state.analytics_figures
         
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_compatibility = px.histogram(
-                x=compatibility_scores,
-                nbins=20,
-                title="Compatibility Score Distribution",
-                labels={'x': 'Compatibility Score (%)', 'count': 'Number of Matches'}
-            )
             st.plotly_chart(fig_compatibility, use_container_width=True)
         
         with col2:
-            # Top buyer-seller pairs
-            top_matches = sorted(matches, key=lambda x: -x.compatibility_score)[:10]
-            
-            top_match_data = []
-            for match in top_matches:
-                buyer_name = next((b['name'] for b in NEXO_BUYERS if b['id'] == match.buyer_id), 'Unknown')
-                seller_name = next((s['name'] for s in NEXO_SELLERS if s['id'] == match.seller_id), 'Unknown')
-                
-                top_match_data.append({
-                    'Pair': f"{buyer_name} - {seller_name}",
-                    'Compatibility': match.compatibility_score
-                })
-            
-            top_df = pd.DataFrame(top_match_data)
-            
-            fig_top = px.bar(
-                top_df,
-                x='Compatibility',
-                y='Pair',
-                orientation='h',
-                title="Top 10 Compatibility Matches",
-                labels={'Compatibility': 'Compatibility Score (%)'}
-            )
             st.plotly_chart(fig_top, use_container_width=True)
     
     # Event efficiency metrics
@@ -819,21 +882,21 @@ def show_analytics():
         with col1:
             st.metric(
                 "Utilization Rate",
-                f"{(stats['scheduled_meetings'] / len(TIME_SLOTS) * 100):.1f}%",
+                f"{(stats['scheduled_meetings'] / _N_SLOTS * 100):.1f}%",
                 help="Percentage of time slots utilized"
             )
         
         with col2:
             st.metric(
                 "Buyer Participation",
-                f"{(stats['unique_buyers_matched'] / len(NEXO_BUYERS) * 100):.1f}%",
+                f"{(stats['unique_buyers_matched'] / _N_BUYERS * 100):.1f}%",
                 help="Percentage of buyers with at least one meeting"
             )
         
         with col3:
             st.metric(
                 "Seller Participation",
-                f"{(stats['unique_sellers_matched'] / len(NEXO_SELLERS) * 100):.1f}%",
+                f"{(stats['unique_sellers_matched'] / _N_SELLERS * 100):.1f}%",
                 help="Percentage of sellers with at least one meeting"
             )
 
@@ -3,12 +3,65 @@
 # Business Logic: Sellers choose buyers (mandatory), Double matches, Buyers get 5 meetings
 
 import pandas as pd
+import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 import logging
+import heapq
+from bisect import bisect_right
+from statistics import fmean
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 
-@dataclass
+# Default compatibility weights (must sum to 1.0)
+DEFAULT_COMPATIBILITY_WEIGHTS = {
+    'interest_alignment': 0.40,    # 40% - Product/service alignment
+    'investment_factor': 0.25,     # 25% - Investment amount factor
+    'company_size': 0.20,          # 20% - Number of locations
+    'facility_type': 0.10,         # 10% - Facility type compatibility
+    'existing_client': 0.05        # 5% - Existing relationship bonus
+}
+
+# Score ladders: inclusive lower bounds and the score for each resulting bucket
+# (plain tuples: bisected per pair by the scalar scorer, searchsorted by the matrix kernel)
+_INVESTMENT_THRESHOLDS = (1000000, 10000000, 50000000, 100000000)  # $1M, $10M, $50M, $100M
+_INVESTMENT_SCORES = (0.2, 0.4, 0.6, 0.8, 1.0)
+_LOCATION_THRESHOLDS = (2, 3, 5)
+_LOCATION_SCORES = (0.4, 0.6, 0.8, 1.0)
+
+# Facility compatibility: a facility type scores 1.0 with sellers offering its product, 0.5 otherwise
+_FLAG_PRODUCTS = ['Equipment', 'Wellness', 'Technology']  # Bit i of a seller's product flags
+_FACILITY_PRODUCTS = {
+    'Gym Chain': 'Equipment',
+    'Premium Gym': 'Equipment',
+    'Wellness Center': 'Wellness',
+    'Corporate Wellness': 'Wellness',
+    'Boutique Studio': 'Technology'
+}
+_FACILITY_CODES = {facility_type: code for code, facility_type in enumerate(_FACILITY_PRODUCTS, start=1)}  # 0 = other
+_FACILITY_LUT = np.full((len(_FACILITY_PRODUCTS) + 1, 1 << len(_FLAG_PRODUCTS)), 0.5)  # [facility_code, product_flags]
+for _facility_type, _product in _FACILITY_PRODUCTS.items():
+    _bit = 1 << _FLAG_PRODUCTS.index(_product)
+    _FACILITY_LUT[_FACILITY_CODES[_facility_type], [flags for flags in range(_FACILITY_LUT.shape[1]) if flags & _bit]] = 1.0
+del _facility_type, _product, _bit
+
+def _pack_bitsets(tag_lists: List[List[str]], tags: Dict[str, int]) -> np.ndarray:
+    """Encode tag lists as rows of uint64 words (bit i set when tag i is present)"""
+    masks = np.zeros((len(tag_lists), max(-(-len(tags) // 64), 1)), dtype=np.uint64)
+    for row, tag_list in enumerate(tag_lists):
+        for tag in tag_list:
+            bit = tags[tag]
+            masks[row, bit // 64] |= np.uint64(1 << (bit % 64))
+    return masks
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Count set bits across the last axis of a uint64 array"""
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+        return np.bitwise_count(words).sum(axis=-1)
+    return np.unpackbits(words.view(np.uint8), axis=-1).sum(axis=-1)
+
+@dataclass(slots=True)
 class Match:
     """Represents a match between buyer and seller"""
     buyer_id: str
@@ -33,70 +86,88 @@ class NEXOEventMatcher:
         self.logger = logging.getLogger(__name__)
         self.matches = []
         self.scheduled_meetings = []
-        self.compatibility_weights = {
-            'interest_alignment': 0.40,    # 40% - Product/service alignment
-            'investment_factor': 0.25,     # 25% - Investment amount factor
-            'company_size': 0.20,          # 20% - Number of locations
-            'facility_type': 0.10,         # 10% - Facility type compatibility
-            'existing_client': 0.05        # 5% - Existing relationship bonus
-        }
+        self.compatibility_weights = dict(DEFAULT_COMPATIBILITY_WEIGHTS)
     
     def calculate_compatibility_score(self, buyer: Dict, seller: Dict) -> float:
         """Calculate compatibility score between buyer and seller (0-100%)"""
+        # Scalar path over the same lookup tables as compute_score_matrix (use that for batches);
+        # terms are added in the same order so both give identical scores
+        weights = self.compatibility_weights
         score = 0.0
         
         # Interest/Product alignment (40%)
         buyer_interests = set(buyer.get('interests', []))
         seller_products = set(seller.get('products', []))
-        interest_overlap = len(buyer_interests.intersection(seller_products))
+        interest_overlap = len(buyer_interests & seller_products)
         max_interests = max(len(buyer_interests), len(seller_products), 1)
-        interest_score = interest_overlap / max_interests
-        score += interest_score * self.compatibility_weights['interest_alignment']
+        score += interest_overlap / max_interests * weights['interest_alignment']
         
         # Investment amount factor (25%)
-        investment = buyer.get('investment_amount', 0)
-        if investment >= 100000000:  # $100M+
-            investment_score = 1.0
-        elif investment >= 50000000:  # $50M+
-            investment_score = 0.8
-        elif investment >= 10000000:  # $10M+
-            investment_score = 0.6
-        elif investment >= 1000000:   # $1M+
-            investment_score = 0.4
-        else:
-            investment_score = 0.2
-        score += investment_score * self.compatibility_weights['investment_factor']
+        investment_score = _INVESTMENT_SCORES[bisect_right(_INVESTMENT_THRESHOLDS, buyer.get('investment_amount', 0))]
+        score += investment_score * weights['investment_factor']
         
         # Company size (number of locations) (20%)
-        locations = buyer.get('locations', 1)
-        if locations >= 5:
-            size_score = 1.0
-        elif locations >= 3:
-            size_score = 0.8
-        elif locations >= 2:
-            size_score = 0.6
-        else:
-            size_score = 0.4
-        score += size_score * self.compatibility_weights['company_size']
+        size_score = _LOCATION_SCORES[bisect_right(_LOCATION_THRESHOLDS, buyer.get('locations', 1))]
+        score += size_score * weights['company_size']
         
         # Facility type compatibility (10%)
-        facility_score = 0.5  # Base compatibility
-        if buyer.get('facility_type') in ['Gym Chain', 'Premium Gym']:
-            if 'Equipment' in seller.get('products', []):
-                facility_score = 1.0
-        elif buyer.get('facility_type') in ['Wellness Center', 'Corporate Wellness']:
-            if 'Wellness' in seller.get('products', []):
-                facility_score = 1.0
-        elif buyer.get('facility_type') == 'Boutique Studio':
-            if 'Technology' in seller.get('products', []):
-                facility_score = 1.0
-        score += facility_score * self.compatibility_weights['facility_type']
+        facility_code = _FACILITY_CODES.get(buyer.get('facility_type'), 0)
+        product_flags = sum(1 << bit for bit, product in enumerate(_FLAG_PRODUCTS) if product in seller_products)
+        score += _FACILITY_LUT.item(facility_code, product_flags) * weights['facility_type']
         
         # Existing client relationship bonus (5%)
-        score += 0.5 * self.compatibility_weights['existing_client']
+        score += 0.5 * weights['existing_client']
         
         return min(score * 100, 100)  # Convert to percentage and cap at 100%
     
+    def compute_score_matrix(self, buyers: List[Dict], sellers: List[Dict]) -> np.ndarray:
+        """
+        Calculate compatibility scores for every buyer/seller pair at once.
+        Returns a (len(buyers), len(sellers)) array of scores (0-100%).
+        """
+        weights = self.compatibility_weights
+        
+        # Pack participant attributes into arrays
+        buyer_interests = [buyer.get('interests', []) for buyer in buyers]
+        seller_products = [seller.get('products', []) for seller in sellers]
+        tags = {tag: i for i, tag in enumerate(sorted(set().union(*buyer_interests, *seller_products)))}
+        interest_masks = _pack_bitsets(buyer_interests, tags)
+        product_masks = _pack_bitsets(seller_products, tags)
+        investment = np.array([buyer.get('investment_amount', 0) for buyer in buyers], dtype=float)
+        locations = np.array([buyer.get('locations', 1) for buyer in buyers], dtype=float)
+        facility_codes = np.array([_FACILITY_CODES.get(buyer.get('facility_type'), 0) for buyer in buyers], dtype=int)
+        product_flags = np.array([sum(1 << bit for bit, product in enumerate(_FLAG_PRODUCTS) if product in products)
+                                  for products in seller_products], dtype=int)
+        
+        # Interest/Product alignment (40%): shared bits over the larger of the two tag counts
+        interest_overlap = _popcount(interest_masks[:, None, :] & product_masks[None, :, :])
+        max_interests = np.maximum(np.maximum(_popcount(interest_masks)[:, None], _popcount(product_masks)[None, :]), 1)
+        interest_score = interest_overlap / max_interests
+        
+        # Investment amount factor (25%)
+        investment_score = np.take(_INVESTMENT_SCORES, np.searchsorted(_INVESTMENT_THRESHOLDS, investment, side='right'))
+        
+        # Company size (number of locations) (20%)
+        size_score = np.take(_LOCATION_SCORES, np.searchsorted(_LOCATION_THRESHOLDS, locations, side='right'))
+        
+        # Weight each factor once at its own shape: buyer-only terms per buyer, the
+        # facility term through its weighted lookup table, the flat bonus a single time
+        terms = [
+            interest_score * weights['interest_alignment'],
+            (investment_score * weights['investment_factor'])[:, None],
+            (size_score * weights['company_size'])[:, None],
+            (_FACILITY_LUT * weights['facility_type'])[facility_codes[:, None], product_flags[None, :]],  # Facility type (10%): one lookup per pair
+            0.5 * weights['existing_client']  # Existing client relationship bonus (5%) is a flat 0.5 for every pair
+        ]
+        
+        # Only additions run per pair, accumulated in factor order so results match the
+        # scalar scoring exactly (regrouping the sum changes low bits and breaks score ties)
+        score = np.zeros((len(buyers), len(sellers)))
+        for term in terms:
+            score += term
+        
+        return np.minimum(score * 100, 100)  # Convert to percentage and cap at 100%
+    
     def find_matches(self, buyers: List[Dict], sellers: List[Dict]) -> List[Match]:
         """
         Find matches using NEXO business logic:
@@ -105,110 +176,110 @@ class NEXOEventMatcher:
         3. Fill remaining buyer slots with AI compatibility matches
         4. Each buyer gets exactly 5 meetings
         """
-        all_matches = []
-        buyer_meetings = {buyer['id']: [] for buyer in buyers}  # Track meetings per buyer
+        doubles, choices, suggestions = [], [], []  # Matches by type, concatenated in priority order at the end
+        meeting_counts = {}  # buyer_id -> number of meetings assigned
+        
+        debug = self.logger.isEnabledFor(logging.DEBUG)  # Only build log messages when they will be emitted
+        
+        # Score every buyer/seller pair once (scores[buyer_pos][seller_pos])
+        scores = self.compute_score_matrix(buyers, sellers).tolist()
         
-        # Step 1: Process Double Matches (highest priority)
-        print("🤝 Processing Double Matches...")
-        for buyer in buyers:
+        # Sellers that selected each buyer as (seller_pos, position in that seller's de-duplicated selections)
+        selected_by = {}
+        for j, seller in enumerate(sellers):
+            for rank, buyer_id in enumerate(dict.fromkeys(seller.get('selected_buyers', []))):
+                selected_by.setdefault(buyer_id, []).append((j, rank))
+        
+        # Single pass over buyers; each buyer's matches depend only on its own selections and scores
+        for i, buyer in enumerate(buyers):
+            buyer_id = buyer['id']
             buyer_selections = set(buyer.get('selected_sellers', []))
-            for seller in sellers:
-                seller_selections = set(seller.get('selected_buyers', []))
-                
-                # Check if both selected each other
-                if buyer['id'] in seller_selections and seller['id'] in buyer_selections:
-                    compatibility = self.calculate_compatibility_score(buyer, seller)
-                    match = Match(
-                        buyer_id=buyer['id'],
+            candidates = selected_by.get(buyer_id, [])
+            matched_seller_ids = set()
+            
+            # Step 1: Double matches (both selected each other) - highest priority
+            for j, _ in candidates:
+                seller = sellers[j]
+                if seller['id'] in buyer_selections and seller['id'] not in matched_seller_ids:
+                    compatibility = scores[i][j]
+                    doubles.append(Match(
+                        buyer_id=buyer_id,
                         seller_id=seller['id'],
                         match_type='double_match',
                         compatibility_score=compatibility,
                         priority=1
-                    )
-                    all_matches.append(match)
-                    buyer_meetings[buyer['id']].append(match)
-                    print(f"   Double Match: {buyer['name']} ↔ {seller['name']} ({compatibility:.1f}%)")
-        
-        # Step 2: Process Seller Choices (buyers must accept - sponsored obligation)
-        print("\n🏷️ Processing Seller Choices (Sponsored Obligations)...")
-        for seller in sellers:
-            seller_selections = set(seller.get('selected_buyers', []))
-            for buyer_id in seller_selections:
-                buyer = next((b for b in buyers if b['id'] == buyer_id), None)
-                if not buyer:
-                    continue
-                
-                # Skip if already matched in double match
-                existing_match = any(m.buyer_id == buyer_id and m.seller_id == seller['id'] 
-                                   for m in buyer_meetings[buyer_id])
-                if existing_match:
+                    ))
+                    matched_seller_ids.add(seller['id'])
+                    if debug:
+                        self.logger.debug(f"   Double Match: {buyer['name']} ↔ {seller['name']} ({compatibility:.1f}%)")
+            meetings = len(matched_seller_ids)
+            
+            # Step 2: Seller choices (buyers must accept - sponsored obligation) while the buyer has room
+            for j, rank in candidates:
+                seller = sellers[j]
+                if seller['id'] in matched_seller_ids or meetings >= 5:
                     continue
-                
-                # Check if buyer has room for more meetings
-                if len(buyer_meetings[buyer_id]) < 5:
-                    compatibility = self.calculate_compatibility_score(buyer, seller)
-                    match = Match(
-                        buyer_id=buyer_id,
-                        seller_id=seller['id'],
-                        match_type='seller_choice',
-                        compatibility_score=compatibility,
-                        priority=2
-                    )
-                    all_matches.append(match)
-                    buyer_meetings[buyer_id].append(match)
-                    print(f"   Seller Choice: {buyer['name']} ← {seller['name']} (MUST ACCEPT)")
-        
-        # Step 3: Fill remaining buyer slots with AI compatibility matches
-        print("\n🤖 Processing AI Compatibility Assignments...")
-        for buyer in buyers:
-            buyer_id = buyer['id']
-            current_meetings = len(buyer_meetings[buyer_id])
+                match = Match(
+                    buyer_id=buyer_id,
+                    seller_id=seller['id'],
+                    match_type='seller_choice',
+                    compatibility_score=scores[i][j],
+                    priority=2
+                )
+                choices.append((j, rank, match))
+                matched_seller_ids.add(seller['id'])
+                meetings += 1
+                if debug:
+                    self.logger.debug(f"   Seller Choice: {buyer['name']} ← {seller['name']} (MUST ACCEPT)")
             
-            if current_meetings < 5:
-                needed_meetings = 5 - current_meetings
-                print(f"   {buyer['name']} needs {needed_meetings} more meetings...")
+            # Step 3: Fill remaining slots with AI compatibility matches
+            if meetings < 5:
+                needed_meetings = 5 - meetings
+                if debug:
+                    self.logger.debug(f"   {buyer['name']} needs {needed_meetings} more meetings...")
                 
-                # Get sellers not already matched with this buyer
-                matched_seller_ids = {m.seller_id for m in buyer_meetings[buyer_id]}
-                available_sellers = [s for s in sellers if s['id'] not in matched_seller_ids]
+                # Look up compatibility with sellers not already matched with this buyer
+                compatibility_scores = [(seller, scores[i][j]) for j, seller in enumerate(sellers)
+                                        if seller['id'] not in matched_seller_ids]
                 
-                # Calculate compatibility with available sellers
-                compatibility_scores = []
-                for seller in available_sellers:
-                    compatibility = self.calculate_compatibility_score(buyer, seller)
-                    compatibility_scores.append((seller, compatibility))
+                # Take the top matches by compatibility (same order and ties as a stable descending sort)
+                top_matches = heapq.nlargest(needed_meetings, compatibility_scores, key=lambda x: x[1])
                 
-                # Sort by compatibility and take top matches
-                compatibility_scores.sort(key=lambda x: x[1], reverse=True)
-                
-                for seller, compatibility in compatibility_scores[:needed_meetings]:
-                    match = Match(
+                for seller, compatibility in top_matches:
+                    suggestions.append(Match(
                         buyer_id=buyer_id,
                         seller_id=seller['id'],
                         match_type='ai_suggestion',
                         compatibility_score=compatibility,
                         priority=3
-                    )
-                    all_matches.append(match)
-                    buyer_meetings[buyer_id].append(match)
-                    print(f"     AI Match: {buyer['name']} ↔ {seller['name']} ({compatibility:.1f}%)")
-        
-        # Print summary
-        print(f"\n📊 MATCHING SUMMARY:")
-        double_matches = len([m for m in all_matches if m.match_type == 'double_match'])
-        seller_choices = len([m for m in all_matches if m.match_type == 'seller_choice'])
-        ai_suggestions = len([m for m in all_matches if m.match_type == 'ai_suggestion'])
-        total = len(all_matches)
-        
-        print(f"   🤝 Double Matches: {double_matches} ({double_matches/total*100:.1f}%)")
-        print(f"   🏷️ Seller Choices: {seller_choices} ({seller_choices/total*100:.1f}%)")
-        print(f"   🤖 AI Suggestions: {ai_suggestions} ({ai_suggestions/total*100:.1f}%)")
-        print(f"   📋 Total Meetings: {total}")
-        
-        # Verify each buyer has exactly 5 meetings
-        for buyer in buyers:
-            meeting_count = len(buyer_meetings[buyer['id']])
-            print(f"   {buyer['name']}: {meeting_count} meetings")
+                    ))
+                    meetings += 1
+                    if debug:
+                        self.logger.debug(f"     AI Match: {buyer['name']} ↔ {seller['name']} ({compatibility:.1f}%)")
+            
+            meeting_counts[buyer_id] = meetings
+        
+        # Double matches in buyer order, seller choices in the order sellers made them, then AI suggestions
+        choices.sort(key=lambda choice: choice[:2])
+        all_matches = doubles + [match for _, _, match in choices] + suggestions
+        
+        # Log summary as a single block
+        if debug:
+            double_matches = len([m for m in all_matches if m.match_type == 'double_match'])
+            seller_choices = len([m for m in all_matches if m.match_type == 'seller_choice'])
+            ai_suggestions = len([m for m in all_matches if m.match_type == 'ai_suggestion'])
+            total = max(len(all_matches), 1)
+            
+            summary = [
+                "📊 MATCHING SUMMARY:",
+                f"   🤝 Double Matches: {double_matches} ({double_matches/total*100:.1f}%)",
+                f"   🏷️ Seller Choices: {seller_choices} ({seller_choices/total*100:.1f}%)",
+                f"   🤖 AI Suggestions: {ai_suggestions} ({ai_suggestions/total*100:.1f}%)",
+                f"   📋 Total Meetings: {len(all_matches)}",
+            ]
+            # Verify each buyer has exactly 5 meetings
+            summary.extend(f"   {buyer['name']}: {meeting_counts[buyer['id']]} meetings" for buyer in buyers)
+            self.logger.debug("\n".join(summary))
         
         return all_matches
     
@@ -216,65 +287,74 @@ class NEXOEventMatcher:
                        time_slots: List[Dict]) -> List[Dict]:
         """Create conflict-free meeting schedule with business priority"""
         scheduled_meetings = []
-        buyer_schedule = {}  # buyer_id -> [time_slots]
-        seller_schedule = {}  # seller_id -> [time_slots]
+        buyer_busy = {}  # buyer_id -> bitmask of booked slots
+        seller_busy = {}  # seller_id -> bitmask of booked slots
+        
+        # Bit k stands for the k-th distinct time slot (first occurrence of each slot id)
+        slots_by_id = {}
+        for time_slot in time_slots:
+            slots_by_id.setdefault(time_slot['id'], time_slot)
+        slots = list(slots_by_id.values())
+        all_slots = (1 << len(slots)) - 1
+        
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        
+        # Name lookups for logging
+        buyer_names = {buyer['id']: buyer['name'] for buyer in buyers}
+        seller_names = {seller['id']: seller['name'] for seller in sellers}
         
-        # Sort matches by priority (double matches first, then seller choices, then AI)
-        sorted_matches = sorted(matches, key=lambda x: (x.priority, -x.compatibility_score))
+        # Sort matches by priority (double matches first, then seller choices, then AI),
+        # then by descending compatibility, using the fields as columns (lexsort is stable like sorted)
+        priorities = np.fromiter((match.priority for match in matches), dtype=np.int64, count=len(matches))
+        compatibility = np.fromiter((match.compatibility_score for match in matches), dtype=float, count=len(matches))
+        sorted_matches = [matches[k] for k in np.lexsort((-compatibility, priorities)).tolist()]
         
-        print(f"\n📅 SCHEDULING {len(sorted_matches)} MEETINGS...")
+        if debug:
+            self.logger.debug(f"📅 SCHEDULING {len(sorted_matches)} MEETINGS...")
         
         for match in sorted_matches:
             buyer_id = match.buyer_id
             seller_id = match.seller_id
             
-            # Find available time slot
-            for time_slot in time_slots:
-                slot_id = time_slot['id']
-                
-                # Check if both buyer and seller are available
-                buyer_available = slot_id not in buyer_schedule.get(buyer_id, [])
-                seller_available = slot_id not in seller_schedule.get(seller_id, [])
-                
-                if buyer_available and seller_available:
-                    # Schedule the meeting
-                    meeting = {
-                        'buyer_id': buyer_id,
-                        'seller_id': seller_id,
-                        'time_slot': slot_id,
-                        'date': time_slot['date'],
-                        'time': time_slot['time'],
-                        'duration': time_slot['duration'],
-                        'match_type': match.match_type,
-                        'compatibility_score': match.compatibility_score,
-                        'priority': match.priority
-                    }
-                    
-                    scheduled_meetings.append(meeting)
-                    
-                    # Update schedules
-                    if buyer_id not in buyer_schedule:
-                        buyer_schedule[buyer_id] = []
-                    if seller_id not in seller_schedule:
-                        seller_schedule[seller_id] = []
-                    
-                    buyer_schedule[buyer_id].append(slot_id)
-                    seller_schedule[seller_id].append(slot_id)
-                    
-                    # Mark match as scheduled
-                    match.meeting_scheduled = True
-                    match.time_slot = slot_id
-                    
-                    # Get names for logging
-                    buyer_name = next((b['name'] for b in buyers if b['id'] == buyer_id), 'Unknown')
-                    seller_name = next((s['name'] for s in sellers if s['id'] == seller_id), 'Unknown')
-                    match_icon = {'double_match': '🤝', 'seller_choice': '🏷️', 'ai_suggestion': '🤖'}[match.match_type]
-                    
-                    print(f"   {match_icon} {time_slot['date']} {time_slot['time']}: {buyer_name} ← → {seller_name}")
-                    
-                    break  # Move to next match
-        
-        print(f"\n✅ SCHEDULED {len(scheduled_meetings)} meetings successfully!")
+            # Find the earliest slot where both buyer and seller are available
+            free = ~(buyer_busy.get(buyer_id, 0) | seller_busy.get(seller_id, 0)) & all_slots
+            if not free:
+                continue
+            slot_bit = free & -free
+            time_slot = slots[slot_bit.bit_length() - 1]
+            slot_id = time_slot['id']
+            
+            # Schedule the meeting
+            meeting = {
+                'buyer_id': buyer_id,
+                'seller_id': seller_id,
+                'time_slot': slot_id,
+                'date': time_slot['date'],
+                'time': time_slot['time'],
+                'duration': time_slot['duration'],
+                'match_type': match.match_type,
+                'compatibility_score': match.compatibility_score,
+                'priority': match.priority
+            }
+            
+            scheduled_meetings.append(meeting)
+            
+            # Update schedules
+            buyer_busy[buyer_id] = buyer_busy.get(buyer_id, 0) | slot_bit
+            seller_busy[seller_id] = seller_busy.get(seller_id, 0) | slot_bit
+            
+            # Mark match as scheduled
+            match.meeting_scheduled = True
+            match.time_slot = slot_id
+            
+            if debug:
+                buyer_name = buyer_names.get(buyer_id, 'Unknown')
+                seller_name = seller_names.get(seller_id, 'Unknown')
+                match_icon = {'double_match': '🤝', 'seller_choice': '🏷️', 'ai_suggestion': '🤖'}[match.match_type]
+                self.logger.debug(f"   {match_icon} {time_slot['date']} {time_slot['time']}: {buyer_name} ← → {seller_name}")
+        
+        if debug:
+            self.logger.debug(f"✅ SCHEDULED {len(scheduled_meetings)} meetings successfully!")
         return scheduled_meetings
     
     def get_matching_statistics(self, matches: List[Match], scheduled_meetings: List[Dict]) -> Dict[str, Any]:
@@ -282,14 +362,15 @@ class NEXOEventMatcher:
         if not matches:
             return {'error': 'No matches found'}
         
-        # Match type distribution
-        match_types = {}
+        # Match type and priority distributions (one pass over matches)
+        match_types = Counter()
+        priority_counts = Counter()
         for match in matches:
-            match_types[match.match_type] = match_types.get(match.match_type, 0) + 1
+            match_types[match.match_type] += 1
+            priority_counts[match.priority] += 1
         
-        # Compatibility statistics
-        compatibility_scores = [match.compatibility_score for match in matches]
-        avg_compatibility = sum(compatibility_scores) / len(compatibility_scores)
+        # Compatibility statistics (single pass, no intermediate list)
+        avg_compatibility = fmean(match.compatibility_score for match in matches)
         
         # Scheduling statistics
         scheduled_count = len(scheduled_meetings)
@@ -297,9 +378,7 @@ class NEXOEventMatcher:
         scheduling_efficiency = (scheduled_count / total_matches) * 100 if total_matches > 0 else 0
         
         # Priority distribution
-        priority_dist = {}
-        for match in matches:
-            priority_dist[f'Priority {match.priority}'] = priority_dist.get(f'Priority {match.priority}', 0) + 1
+        priority_dist = {f'Priority {priority}': count for priority, count in priority_counts.items()}
         
         return {
             'total_matches': total_matches,
@@ -307,10 +386,10 @@ class NEXOEventMatcher:
             'unscheduled_matches': total_matches - scheduled_count,
             'scheduling_efficiency': round(scheduling_efficiency, 2),
             'average_compatibility': round(avg_compatibility, 2),
-            'match_type_distribution': match_types,
+            'match_type_distribution': dict(match_types),
             'priority_distribution': priority_dist,
-            'unique_buyers_matched': len(set(match.buyer_id for match in matches)),
-            'unique_sellers_matched': len(set(match.seller_id for match in matches))
+            'unique_buyers_matched': len({match.buyer_id for match in matches}),
+            'unique_sellers_matched': len({match.seller_id for match in matches})
         }
     
     def export_schedule_csv(self, scheduled_meetings: List[Dict], buyers: List[Dict], sellers: List[Dict]) -> str:
@@ -322,24 +401,33 @@ class NEXOEventMatcher:
         buyer_dict = {buyer['id']: buyer for buyer in buyers}
         seller_dict = {seller['id']: seller for seller in sellers}
         
-        csv_data = []
-        csv_data.append("Date,Time,Buyer,Buyer Company,Seller,Seller Company,Match Type,Compatibility Score,Priority")
+        meeting_buyers = [buyer_dict.get(meeting['buyer_id'], {}) for meeting in scheduled_meetings]
+        meeting_sellers = [seller_dict.get(meeting['seller_id'], {}) for meeting in scheduled_meetings]
+        match_types = [meeting['match_type'] for meeting in scheduled_meetings]
+        match_type_display = {match_type: match_type.replace('_', ' ').title() for match_type in set(match_types)}
         
-        for meeting in scheduled_meetings:
-            buyer = buyer_dict.get(meeting['buyer_id'], {})
-            seller = seller_dict.get(meeting['seller_id'], {})
-            
-            row = [
-                meeting['date'],
-                meeting['time'],
-                buyer.get('name', 'Unknown'),
-                buyer.get('company', 'Unknown'),
-                seller.get('name', 'Unknown'),
-                seller.get('company', 'Unknown'),
-                meeting['match_type'].replace('_', ' ').title(),
-                str(round(meeting['compatibility_score'], 1)),
-                str(meeting['priority'])
-            ]
-            csv_data.append(','.join(row))
+        csv_df = pd.DataFrame({
+            'Date': [meeting['date'] for meeting in scheduled_meetings],
+            'Time': [meeting['time'] for meeting in scheduled_meetings],
+            'Buyer': [buyer.get('name', 'Unknown') for buyer in meeting_buyers],
+            'Buyer Company': [buyer.get('company', 'Unknown') for buyer in meeting_buyers],
+            'Seller': [seller.get('name', 'Unknown') for seller in meeting_sellers],
+            'Seller Company': [seller.get('company', 'Unknown') for seller in meeting_sellers],
+            'Match Type': [match_type_display[match_type] for match_type in match_types],
+            'Compatibility Score': [meeting['compatibility_score'] for meeting in scheduled_meetings],
+            'Priority': [meeting['priority'] for meeting in scheduled_meetings]
+        })
         
-        return '\n'.join(csv_data) 
\ No newline at end of file
+        # Written by pandas' C CSV writer; drop the final line terminator to keep the previous output
+        return csv_df.to_csv(index=False, float_format='%.1f', lineterminator='\n')[:-1]
+
+@lru_cache(maxsize=1)
+def get_cost_matrix() -> np.ndarray:
+    """
+    Return the read-only float32 assignment cost matrix for the event data (BUYER_ORDER x
+    SELLER_ORDER): 100 minus the default-weight compatibility score, so lower cost is a better pair
+    """
+    from nexo_data import NEXO_BUYERS, NEXO_SELLERS
+    cost = (100 - NEXOEventMatcher().compute_score_matrix(NEXO_BUYERS, NEXO_SELLERS)).astype(np.float32)
+    cost.setflags(write=False)
+    return cost
\ No newline at end of file
@@ -2,9 +2,16 @@
 # Real NEXO 2023 Fitness Industry Event Data
 # B2B Networking Event Matching System
 
-import pandas as pd
-from typing import List, Dict, Any
-from datetime import datetime, time
+import sys
+import numpy as np
+from typing import TYPE_CHECKING, List, Dict, Any, FrozenSet, Mapping, Tuple
+from types import MappingProxyType
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 # Real NEXO 2023 Buyers (Fitness Companies looking for suppliers)
 NEXO_BUYERS = [
@@ -305,66 +312,304 @@ NEXO_SELLERS = [
     }
 ]
 
+# Record schemas, checked once at import so the derived columns below can index fields directly
+_BUYER_SCHEMA: Dict[str, type] = {
+    'id': str, 'name': str, 'company': str, 'investment_amount': int, 'locations': int,
+    'facility_type': str, 'sponsorship_tier': str, 'interests': list, 'selected_sellers': list,
+    'region': str, 'meeting_limit': int
+}
+_SELLER_SCHEMA: Dict[str, type] = {
+    'id': str, 'name': str, 'company': str, 'products': list, 'contact': str, 'region': str,
+    'selected_buyers': list, 'description': str, 'specialties': list
+}
+
+def _validate_records(records: List[Dict[str, Any]], schema: Dict[str, type], kind: str) -> None:
+    """Raise ValueError if any record is missing a schema field or has the wrong type"""
+    for record in records:
+        for field, field_type in schema.items():
+            if not isinstance(record.get(field), field_type):
+                raise ValueError(f"{kind} {record.get('id', '?')}: field '{field}' missing or not {field_type.__name__}")
+
+_validate_records(NEXO_BUYERS, _BUYER_SCHEMA, 'buyer')
+_validate_records(NEXO_SELLERS, _SELLER_SCHEMA, 'seller')
+
+# Intern the categorical strings so equal values share one object across all records
+for _buyer in NEXO_BUYERS:
+    for _field in ('facility_type', 'sponsorship_tier', 'region'):
+        _buyer[_field] = sys.intern(_buyer[_field])
+    _buyer['interests'] = [sys.intern(category) for category in _buyer['interests']]
+for _seller in NEXO_SELLERS:
+    _seller['region'] = sys.intern(_seller['region'])
+    _seller['products'] = [sys.intern(category) for category in _seller['products']]
+del _buyer, _seller, _field
+
 # NEXO 2023 Event Schedule - May 18-19, 2023
-TIME_SLOTS = [
-    # May 18, 2023
-    {'id': 'slot_001', 'date': '2023-05-18', 'time': '09:00', 'duration': 15},
-    {'id': 'slot_002', 'date': '2023-05-18', 'time': '09:15', 'duration': 15},
-    {'id': 'slot_003', 'date': '2023-05-18', 'time': '09:30', 'duration': 15},
-    {'id': 'slot_004', 'date': '2023-05-18', 'time': '09:45', 'duration': 15},
-    {'id': 'slot_005', 'date': '2023-05-18', 'time': '10:00', 'duration': 15},
-    {'id': 'slot_006', 'date': '2023-05-18', 'time': '10:15', 'duration': 15},
-    {'id': 'slot_007', 'date': '2023-05-18', 'time': '10:30', 'duration': 15},
-    {'id': 'slot_008', 'date': '2023-05-18', 'time': '10:45', 'duration': 15},
-    {'id': 'slot_009', 'date': '2023-05-18', 'time': '11:00', 'duration': 15},
-    {'id': 'slot_010', 'date': '2023-05-18', 'time': '11:15', 'duration': 15},
-    {'id': 'slot_011', 'date': '2023-05-18', 'time': '11:30', 'duration': 15},
-    {'id': 'slot_012', 'date': '2023-05-18', 'time': '11:45', 'duration': 15},
-    {'id': 'slot_013', 'date': '2023-05-18', 'time': '14:00', 'duration': 15},
-    {'id': 'slot_014', 'date': '2023-05-18', 'time': '14:15', 'duration': 15},
-    {'id': 'slot_015', 'date': '2023-05-18', 'time': '14:30', 'duration': 15},
-    # May 19, 2023
-    {'id': 'slot_016', 'date': '2023-05-19', 'time': '09:00', 'duration': 15},
-    {'id': 'slot_017', 'date': '2023-05-19', 'time': '09:15', 'duration': 15},
-    {'id': 'slot_018', 'date': '2023-05-19', 'time': '09:30', 'duration': 15},
-    {'id': 'slot_019', 'date': '2023-05-19', 'time': '09:45', 'duration': 15},
-    {'id': 'slot_020', 'date': '2023-05-19', 'time': '10:00', 'duration': 15},
-    {'id': 'slot_021', 'date': '2023-05-19', 'time': '10:15', 'duration': 15},
-    {'id': 'slot_022', 'date': '2023-05-19', 'time': '10:30', 'duration': 15},
-    {'id': 'slot_023', 'date': '2023-05-19', 'time': '10:45', 'duration': 15},
-    {'id': 'slot_024', 'date': '2023-05-19', 'time': '11:00', 'duration': 15},
-    {'id': 'slot_025', 'date': '2023-05-19', 'time': '11:15', 'duration': 15},
-    {'id': 'slot_026', 'date': '2023-05-19', 'time': '11:30', 'duration': 15},
-    {'id': 'slot_027', 'date': '2023-05-19', 'time': '11:45', 'duration': 15},
-    {'id': 'slot_028', 'date': '2023-05-19', 'time': '14:00', 'duration': 15},
-    {'id': 'slot_029', 'date': '2023-05-19', 'time': '14:15', 'duration': 15},
-    {'id': 'slot_030', 'date': '2023-05-19', 'time': '14:30', 'duration': 15},
+# Meeting blocks as (date, first slot start, block end); slots run back to back inside each block
+SLOT_DURATION = 15  # minutes
+EVENT_EPOCH = datetime(2023, 5, 18)  # slot 'start_min' counts minutes from here
+_SCHEDULE = [
+    ('2023-05-18', '09:00', '12:00'),
+    ('2023-05-18', '14:00', '14:45'),
+    ('2023-05-19', '09:00', '12:00'),
+    ('2023-05-19', '14:00', '14:45'),
 ]
 
-def get_buyers_df() -> pd.DataFrame:
-    """Return buyers data as DataFrame"""
-    return pd.DataFrame(NEXO_BUYERS)
+def _build_slots(schedule: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+    """Expand meeting blocks into numbered slots of SLOT_DURATION minutes"""
+    step = timedelta(minutes=SLOT_DURATION)
+    slots = []
+    for date, start, end in schedule:
+        slot_start = datetime.fromisoformat(f"{date}T{start}")
+        block_end = datetime.fromisoformat(f"{date}T{end}")
+        while slot_start + step <= block_end:
+            slots.append({
+                'id': f"slot_{len(slots) + 1:03d}",
+                'date': date,
+                'time': slot_start.strftime('%H:%M'),
+                'duration': SLOT_DURATION,
+                'start_min': int((slot_start - EVENT_EPOCH).total_seconds() // 60)
+            })
+            slot_start += step
+    return slots
 
-def get_sellers_df() -> pd.DataFrame:
-    """Return sellers data as DataFrame"""
-    return pd.DataFrame(NEXO_SELLERS)
+TIME_SLOTS = _build_slots(_SCHEDULE)
 
-def get_event_summary() -> Dict[str, Any]:
-    """Return event summary statistics"""
+# Time slots grouped by event day (slot order preserved)
+SLOTS_BY_DATE: Dict[str, List[Dict[str, Any]]] = {}
+for _slot in TIME_SLOTS:
+    SLOTS_BY_DATE.setdefault(_slot['date'], []).append(_slot)
+del _slot
+
+# Time slots as a read-only structured array (start as datetime64 minutes, duration in minutes);
+# the id field is sized to the longest slot id so ids are never truncated
+TIME_SLOT_DTYPE = np.dtype([
+    ('id', f"U{max((len(slot['id']) for slot in TIME_SLOTS), default=1)}"),
+    ('start', 'datetime64[m]'),
+    ('duration', 'i2')
+])
+TIME_SLOTS_NP = np.array(
+    [(slot['id'], f"{slot['date']}T{slot['time']}", slot['duration']) for slot in TIME_SLOTS],
+    dtype=TIME_SLOT_DTYPE
+)
+TIME_SLOTS_NP.setflags(write=False)
+
+# Slot start times as minutes from EVENT_EPOCH, in TIME_SLOTS order; two slots clash for
+# the same person when abs(a - b) < SLOT_DURATION
+SLOT_START_MIN = np.array([slot['start_min'] for slot in TIME_SLOTS], dtype=np.int16)
+SLOT_START_MIN.setflags(write=False)
+
+# Participant records keyed by id
+BUYERS_BY_ID: Dict[str, Dict[str, Any]] = {buyer['id']: buyer for buyer in NEXO_BUYERS}
+SELLERS_BY_ID: Dict[str, Dict[str, Any]] = {seller['id']: seller for seller in NEXO_SELLERS}
+
+# Selections as id -> frozenset adjacency (the record lists keep their order, which sets
+# seller-choice precedence), and the (buyer_id, seller_id) pairs where both sides selected each other
+BUYER_ADJ: Dict[str, FrozenSet[str]] = {buyer['id']: frozenset(buyer['selected_sellers']) for buyer in NEXO_BUYERS}
+SELLER_ADJ: Dict[str, FrozenSet[str]] = {seller['id']: frozenset(seller['selected_buyers']) for seller in NEXO_SELLERS}
+MUTUAL_EDGES: FrozenSet[Tuple[str, str]] = frozenset(
+    (buyer_id, seller_id)
+    for buyer_id, seller_ids in BUYER_ADJ.items()
+    for seller_id in seller_ids
+    if buyer_id in SELLER_ADJ.get(seller_id, ())
+)
+
+# Mutual-selection graph in CSR form: row i lists the seller indices mutually selected with
+# buyer i, for sparse bipartite solvers (e.g. scipy.sparse.csgraph.maximum_bipartite_matching)
+BUYER_IDX: Dict[str, int] = {buyer['id']: i for i, buyer in enumerate(NEXO_BUYERS)}
+SELLER_IDX: Dict[str, int] = {seller['id']: j for j, seller in enumerate(NEXO_SELLERS)}
+_mutual_rows = [
+    sorted(SELLER_IDX[seller_id] for seller_id in BUYER_ADJ[buyer['id']] if (buyer['id'], seller_id) in MUTUAL_EDGES)
+    for buyer in NEXO_BUYERS
+]
+ADJ_INDPTR = np.cumsum([0] + [len(row) for row in _mutual_rows], dtype=np.int32)
+ADJ_INDICES = np.array([j for row in _mutual_rows for j in row], dtype=np.int32)
+ADJ_INDPTR.setflags(write=False)
+ADJ_INDICES.setflags(write=False)
+del _mutual_rows
+
+# Selections as deduplicated, sorted positions into NEXO_SELLERS / NEXO_BUYERS (small ints
+# instead of id strings): per-row frozensets for membership tests, and small-int matrices padded
+# with -1 (one row per participant) for vectorized adjacency queries
+BUYER_SELECTED_POS: Tuple[FrozenSet[int], ...] = tuple(
+    frozenset(SELLER_IDX[seller_id] for seller_id in buyer['selected_sellers'] if seller_id in SELLER_IDX)
+    for buyer in NEXO_BUYERS
+)
+SELLER_SELECTED_POS: Tuple[FrozenSet[int], ...] = tuple(
+    frozenset(BUYER_IDX[buyer_id] for buyer_id in seller['selected_buyers'] if buyer_id in BUYER_IDX)
+    for seller in NEXO_SELLERS
+)
+
+def _index_dtype(n: int) -> np.dtype:
+    """Return the smallest signed integer dtype holding 0..n-1 and -1 (int8 up to n = 128)"""
+    return np.promote_types(np.int8, np.min_scalar_type(-max(n, 1)))
+
+def _padded_rows(rows: Tuple[FrozenSet[int], ...], n: int) -> np.ndarray:
+    """Stack sorted rows of positions below n into a read-only matrix padded with -1"""
+    matrix = np.full((len(rows), max(map(len, rows), default=0)), -1, dtype=_index_dtype(n))
+    for i, row in enumerate(rows):
+        matrix[i, :len(row)] = sorted(row)
+    matrix.setflags(write=False)
+    return matrix
+
+BUYER_SELECTED = _padded_rows(BUYER_SELECTED_POS, len(NEXO_SELLERS))
+SELLER_SELECTED = _padded_rows(SELLER_SELECTED_POS, len(NEXO_BUYERS))
+
+# Row/column ids of the matrices indexed by buyer and seller position
+BUYER_ORDER: Tuple[str, ...] = tuple(buyer['id'] for buyer in NEXO_BUYERS)
+SELLER_ORDER: Tuple[str, ...] = tuple(seller['id'] for seller in NEXO_SELLERS)
+
+# Buyer numeric columns (in NEXO_BUYERS order) for vectorized totals and scoring
+BUYER_INVESTMENT = np.array([buyer['investment_amount'] for buyer in NEXO_BUYERS], dtype=np.int64)
+BUYER_LOCATIONS = np.array([buyer['locations'] for buyer in NEXO_BUYERS], dtype=np.int16)
+
+# Categorical fields as small-int codes, int8 unless a field has over 128 values
+# (tiers in rank order, others in order of first appearance)
+TIER_CODE: Dict[str, int] = {'Bronze': 0, 'Silver': 1, 'Gold': 2, 'Platinum': 3}
+TIER_WEIGHT = np.array([1.0, 1.5, 2.0, 3.0], dtype=np.float32)  # indexed by tier code
+REGION_CODE: Dict[str, int] = {
+    region: code for code, region in enumerate(dict.fromkeys(p['region'] for p in NEXO_BUYERS + NEXO_SELLERS))
+}
+# Facility types as plain category labels; unrelated to the matcher's _FACILITY_CODES, which
+# number the types it scores for the _FACILITY_LUT lookup (do not index that table with these)
+FACILITY_TYPE_CODE: Dict[str, int] = {
+    facility: code for code, facility in enumerate(dict.fromkeys(buyer['facility_type'] for buyer in NEXO_BUYERS))
+}
+
+
+def _code_column(codes: Dict[str, int], values: List[str]) -> np.ndarray:
+    """Encode values as a column of their codes, in the smallest dtype that holds every code"""
+    return np.fromiter((codes[value] for value in values), dtype=_index_dtype(len(codes)), count=len(values))
+
+
+BUYER_TIER = _code_column(TIER_CODE, [buyer['sponsorship_tier'] for buyer in NEXO_BUYERS])
+BUYER_REGION = _code_column(REGION_CODE, [buyer['region'] for buyer in NEXO_BUYERS])
+BUYER_FACILITY_TYPE = _code_column(FACILITY_TYPE_CODE, [buyer['facility_type'] for buyer in NEXO_BUYERS])
+SELLER_REGION = _code_column(REGION_CODE, [seller['region'] for seller in NEXO_SELLERS])
+
+# Processing orders for greedy/auction-style matchers: highest-investment buyers and
+# most-selective sellers first (stable, so ties keep NEXO_BUYERS / NEXO_SELLERS order)
+NEXO_BUYERS_BY_VALUE: Tuple[Dict[str, Any], ...] = tuple(sorted(NEXO_BUYERS, key=lambda b: -b['investment_amount']))
+NEXO_SELLERS_BY_DEGREE: Tuple[Dict[str, Any], ...] = tuple(sorted(NEXO_SELLERS, key=lambda s: -len(s['selected_buyers'])))
+BUYER_ORDER_BY_VALUE = np.argsort(-BUYER_INVESTMENT, kind='stable').astype(np.int32)  # positions into the buyer columns
+
+# Product/interest categories as bitmasks (bit i = CATEGORIES[i]); overlap is (a & b).bit_count()
+CATEGORIES = ('Equipment', 'Technology', 'Supplements', 'Software', 'Nutrition', 'Wellness', 'Accessories')
+_CATEGORY_BIT = {category: 1 << i for i, category in enumerate(CATEGORIES)}
+BUYER_INTEREST_MASK: Dict[str, int] = {
+    buyer['id']: sum(_CATEGORY_BIT[category] for category in set(buyer['interests'])) for buyer in NEXO_BUYERS
+}
+SELLER_PRODUCT_MASK: Dict[str, int] = {
+    seller['id']: sum(_CATEGORY_BIT[category] for category in set(seller['products'])) for seller in NEXO_SELLERS
+}
+
+# The same masks as columns in NEXO_BUYERS / NEXO_SELLERS order (structure-of-arrays with
+# BUYER_INVESTMENT and BUYER_LOCATIONS) for array kernels; up to 8 categories fit in uint8
+_MASK_DTYPE = np.min_scalar_type((1 << len(CATEGORIES)) - 1)
+BUYER_INTEREST_BITS = np.array([BUYER_INTEREST_MASK[buyer['id']] for buyer in NEXO_BUYERS], dtype=_MASK_DTYPE)
+SELLER_PRODUCT_BITS = np.array([SELLER_PRODUCT_MASK[seller['id']] for seller in NEXO_SELLERS], dtype=_MASK_DTYPE)
+for _column in (BUYER_INVESTMENT, BUYER_LOCATIONS, BUYER_TIER, BUYER_REGION, BUYER_FACILITY_TYPE, SELLER_REGION,
+                TIER_WEIGHT, BUYER_ORDER_BY_VALUE, BUYER_INTEREST_BITS, SELLER_PRODUCT_BITS):
+    _column.setflags(write=False)
+del _column
+
+# Inverted indexes: category -> ids of the buyers interested in it / sellers offering it
+_buyers_by_interest: Dict[str, set] = {}
+for _buyer in NEXO_BUYERS:
+    for _category in _buyer['interests']:
+        _buyers_by_interest.setdefault(_category, set()).add(_buyer['id'])
+_sellers_by_product: Dict[str, set] = {}
+for _seller in NEXO_SELLERS:
+    for _category in _seller['products']:
+        _sellers_by_product.setdefault(_category, set()).add(_seller['id'])
+BUYERS_BY_INTEREST: Dict[str, FrozenSet[str]] = {c: frozenset(ids) for c, ids in _buyers_by_interest.items()}
+SELLERS_BY_PRODUCT: Dict[str, FrozenSet[str]] = {c: frozenset(ids) for c, ids in _sellers_by_product.items()}
+del _buyers_by_interest, _sellers_by_product, _buyer, _seller, _category
+
+def candidates_for(buyer_id: str) -> FrozenSet[str]:
+    """Return ids of the sellers offering at least one of the buyer's interests"""
+    buyer = BUYERS_BY_ID.get(buyer_id)
+    if buyer is None:
+        return frozenset()
+    return frozenset().union(*(SELLERS_BY_PRODUCT.get(c, ()) for c in buyer['interests']))
+
+@lru_cache(maxsize=1)
+def _build_buyers_df() -> 'pd.DataFrame':
+    """Build the typed buyers DataFrame"""
+    # pandas is imported on first use so plain data/array users don't load it
+    import pandas as pd
+    df = pd.DataFrame(NEXO_BUYERS)
+    # Categorical filter columns compare on integer codes instead of strings
+    # (categories kept in order of first appearance, like object-dtype counts)
+    for column in ['region', 'sponsorship_tier', 'facility_type']:
+        df[column] = df[column].astype(pd.CategoricalDtype(df[column].unique()))
+    # Smallest integer dtypes that hold the values exactly
+    for column in ['investment_amount', 'locations', 'meeting_limit']:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+    return df
+
+@lru_cache(maxsize=1)
+def _build_sellers_df() -> 'pd.DataFrame':
+    """Build the typed sellers DataFrame"""
+    import pandas as pd
+    df = pd.DataFrame(NEXO_SELLERS)
+    df['region'] = df['region'].astype(pd.CategoricalDtype(df['region'].unique()))
+    return df
+
+def get_buyers_df() -> 'pd.DataFrame':
+    """Return buyers data as DataFrame (built once, copied per call)"""
+    return _build_buyers_df().copy()
+
+def get_sellers_df() -> 'pd.DataFrame':
+    """Return sellers data as DataFrame (built once, copied per call)"""
+    return _build_sellers_df().copy()
+
+@lru_cache(maxsize=1)
+def get_buyers_arrow() -> 'pa.Table':
+    """Return buyers data as a columnar pyarrow Table (list columns stay list<string>)"""
+    # pyarrow (see requirements.txt) is imported lazily so plain data users don't load it
+    import pyarrow as pa
+    return pa.Table.from_pylist(NEXO_BUYERS)
+
+@lru_cache(maxsize=1)
+def get_sellers_arrow() -> 'pa.Table':
+    """Return sellers data as a columnar pyarrow Table (list columns stay list<string>)"""
+    import pyarrow as pa
+    return pa.Table.from_pylist(NEXO_SELLERS)
+
+def get_time_slots_np() -> np.ndarray:
+    """Return time slots as a read-only structured array (id, start, duration)"""
+    return TIME_SLOTS_NP
+
+def get_bipartite_csr() -> Tuple[np.ndarray, np.ndarray, int, int]:
+    """Return the mutual-selection graph as (indptr, indices, n_buyers, n_sellers)"""
+    return ADJ_INDPTR, ADJ_INDICES, len(NEXO_BUYERS), len(NEXO_SELLERS)
+
+@lru_cache(maxsize=1)
+def _build_event_summary() -> Dict[str, Any]:
+    """Build the event summary statistics"""
     return {
         'total_buyers': len(NEXO_BUYERS),
         'total_sellers': len(NEXO_SELLERS),
         'total_time_slots': len(TIME_SLOTS),
         'event_dates': ['2023-05-18', '2023-05-19'],
-        'total_investment': sum(buyer.get('investment_amount', 0) for buyer in NEXO_BUYERS),
-        'total_locations': sum(buyer.get('locations', 0) for buyer in NEXO_BUYERS)
+        'total_investment': int(BUYER_INVESTMENT.sum()),
+        'total_locations': int(BUYER_LOCATIONS.sum())
     }
 
-def get_sponsorship_limits() -> Dict[str, int]:
-    """Return meeting limits by sponsorship tier"""
-    return {
-        'Platinum': 5,
-        'Gold': 5,
-        'Silver': 5,
-        'Bronze': 5
-    } 
\ No newline at end of file
+def get_event_summary() -> Dict[str, Any]:
+    """Return event summary statistics (built once, copied per call)"""
+    summary = dict(_build_event_summary())
+    summary['event_dates'] = list(summary['event_dates'])
+    return summary
+
+# Meeting limits by sponsorship tier (read-only view, shared by every caller)
+_SPONSORSHIP_LIMITS: Mapping[str, int] = MappingProxyType({
+    'Platinum': 5,
+    'Gold': 5,
+    'Silver': 5,
+    'Bronze': 5
+})
+
+def get_sponsorship_limits() -> Mapping[str, int]:
+    """Return meeting limits by sponsorship tier (read-only mapping)"""
+    return _SPONSORSHIP_LIMITS 
\ No newline at end of file